@@ -7,6 +7,7 @@ from . import (
     dataframe,
     density,
     dictionary,
+    enrichment,
     feature_by_sample,
     function_heat_map,
     gct,
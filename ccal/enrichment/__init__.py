@@ -0,0 +1 @@
+from .score import score
@@ -0,0 +1,142 @@
+from multiprocessing import Pool
+
+from numpy import (
+    arange,
+    argsort,
+    array,
+    array_split,
+    concatenate,
+    cumsum,
+    diff,
+    empty,
+    errstate,
+    full,
+    maximum,
+    minimum,
+    nan,
+    repeat,
+    where,
+)
+from pandas import DataFrame
+from scipy.sparse import csr_matrix
+
+from ..gmt import GeneSetCollection
+
+
+def _rank(nu_):
+    po_ = empty(nu_.size, dtype=int)
+
+    po_[argsort(-nu_, kind="stable")] = arange(1, nu_.size + 1)
+
+    return po_
+
+
+def _walk(me_se_ge, po_, we_, ro_, n_):
+    n_ge = po_.size
+
+    pt_ = me_se_ge.indptr[:-1]
+
+    poh_ = po_[me_se_ge.indices]
+
+    ie_ = argsort(ro_ * (n_ge + 1) + poh_, kind="stable")
+
+    poh_ = poh_[ie_]
+
+    weh_ = we_[me_se_ge.indices][ie_]
+
+    cu_ = cumsum(weh_)
+
+    cu_ -= repeat(concatenate([[0], cu_])[pt_], n_)
+
+    we_se = repeat(me_se_ge @ we_, n_)
+
+    mi_ = (poh_ - (arange(poh_.size) - repeat(pt_, n_) + 1)) / repeat(n_ge - n_, n_)
+
+    dp_ = cu_ / we_se - mi_
+
+    dm_ = (cu_ - weh_) / we_se - mi_
+
+    es_ = full(n_.size, nan)
+
+    ha_ = 0 < n_
+
+    ma_ = maximum.reduceat(dp_, pt_[ha_])
+
+    mn_ = minimum.reduceat(dm_, pt_[ha_])
+
+    es_[ha_] = where(abs(mn_) < abs(ma_), ma_, mn_)
+
+    return es_
+
+
+def _score_block(nu_ge_sa, me_se_ge, al, me):
+    n_ge, n_sa = nu_ge_sa.shape
+
+    n_ = diff(me_se_ge.indptr)
+
+    ro_ = repeat(arange(n_.size), n_)
+
+    es_se_sa = full([n_.size, n_sa], nan)
+
+    with errstate(divide="ignore", invalid="ignore"):
+        for ie in range(n_sa):
+            po_ = _rank(nu_ge_sa[:, ie])
+
+            re_ = n_ge - po_ + 1
+
+            we_ = re_**al
+
+            if me == "integral":
+                es_se_sa[:, ie] = (me_se_ge @ (we_ * re_)) / (me_se_ge @ we_) - (
+                    n_ge * (n_ge + 1) / 2 - me_se_ge @ re_
+                ) / (n_ge - n_)
+
+            elif me == "ks":
+                es_se_sa[:, ie] = _walk(me_se_ge, po_, we_, ro_, n_)
+
+    return es_se_sa
+
+
+def score(nu_ge_sa, se_ge_, al=0.25, me="integral", n_jo=1):
+    if isinstance(se_ge_, GeneSetCollection):
+        gs = se_ge_
+
+    else:
+        gs = GeneSetCollection(se_ge_)
+
+    ie_ = array([gs.ge_ie.get(ge, -1) for ge in nu_ge_sa.index])
+
+    ha_ = 0 <= ie_
+
+    me_se_ge = gs.me_se_ge @ csr_matrix(
+        (
+            full(ha_.sum(), 1, dtype=gs.me_se_ge.dtype),
+            (ie_[ha_], arange(ie_.size)[ha_]),
+        ),
+        shape=[gs.ge_.size, ie_.size],
+    )
+
+    me_se_ge.sort_indices()
+
+    print(
+        "Scoring {} sets ({} with genes) in {} samples".format(
+            me_se_ge.shape[0], (0 < me_se_ge.getnnz(axis=1)).sum(), nu_ge_sa.shape[1]
+        )
+    )
+
+    po = Pool(processes=n_jo)
+
+    es_se_sa = concatenate(
+        po.starmap(
+            _score_block,
+            (
+                [nub_ge_sa, me_se_ge, al, me]
+                for nub_ge_sa in array_split(nu_ge_sa.values, n_jo, axis=1)
+            ),
+        ),
+        axis=1,
+    )
+
+    po.terminate()
+
+    return DataFrame(data=es_se_sa, index=gs.se_, columns=nu_ge_sa.columns)
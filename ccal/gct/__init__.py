@@ -1 +1,3 @@
 from .read import read
+from .read_chunk import read_chunk
+from .write import write
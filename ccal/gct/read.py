@@ -1,7 +1,144 @@
-from pandas import read_csv
+from json import dump, load as json_load
+from os import makedirs, remove, replace
+from os.path import exists, join
 
+from numpy import asarray, dtype, float64, load, save
+from pandas import DataFrame, Index, read_csv
 
-def read(pa):
-    return read_csv(pa, sep="\t", skiprows=2, index_col=0).drop(
-        labels=["Description"], axis=1
+from ..path import get_stamp
+from ..path import open_text
+
+
+def _read_column(pa):
+    with open_text(pa) as io:
+        for _ in range(2):
+            io.readline()
+
+        return io.readline().rstrip("\n").split(sep="\t")
+
+
+def _get_value(pac, dt):
+    return join(pac, "value_{}.npy".format(dtype(dt).name))
+
+
+def _save(pa, ar):
+    pat = "{}.tmp".format(pa)
+
+    with open(pat, mode="wb") as io:
+        save(io, ar)
+
+    replace(pat, pa)
+
+
+def _write_cache(pa, da):
+    pac = "{}.cache".format(pa)
+
+    makedirs(pac, exist_ok=True)
+
+    paj = join(pac, "cache.json")
+
+    st = get_stamp(pa)
+
+    dt_ = []
+
+    if exists(paj):
+        with open(paj) as io:
+            ca = json_load(io)
+
+        if ca["stamp"] == st:
+            dt_ = ca["dtype"]
+
+        remove(paj)
+
+    _save(_get_value(pac, da.values.dtype), da.values)
+
+    _save(join(pac, "index.npy"), da.index.values.astype(str))
+
+    _save(join(pac, "column.npy"), da.columns.values.astype(str))
+
+    with open(paj, mode="w") as io:
+        dump(
+            {
+                "stamp": st,
+                "index": da.index.name,
+                "dtype": sorted(set(dt_ + [da.values.dtype.name])),
+            },
+            io,
+            indent=2,
+        )
+
+
+def _read_cache(pa, dt):
+    pac = "{}.cache".format(pa)
+
+    paj = join(pac, "cache.json")
+
+    if not exists(paj):
+        return None
+
+    with open(paj) as io:
+        ca = json_load(io)
+
+    if ca["stamp"] != get_stamp(pa) or dtype(dt).name not in ca.get("dtype", []):
+        return None
+
+    return (
+        load(_get_value(pac, dt), mmap_mode="c"),
+        Index(data=load(join(pac, "index.npy")), name=ca["index"]),
+        Index(data=load(join(pac, "column.npy"))),
     )
+
+
+def _get_position(an_, se_):
+    if se_ is None:
+        return slice(None)
+
+    else:
+        ie_ = an_.get_indexer(se_)
+
+        assert (0 <= ie_).all(), "Missing {}".format(
+            [se for se, ie in zip(se_, ie_) if ie < 0]
+        )
+
+        return ie_
+
+
+def read(pa, ro_=None, co_=None, dt=float64, ca=False):
+    if ca:
+        ar_ = _read_cache(pa, dt)
+
+    else:
+        ar_ = None
+
+    if ar_ is None:
+        da = read_csv(
+            pa,
+            sep="\t",
+            skiprows=2,
+            index_col=0,
+            dtype={co: dt for co in _read_column(pa)[2:]},
+            float_precision="round_trip",
+        ).drop(labels=["Description"], axis=1)
+
+        if ca:
+            try:
+                _write_cache(pa, da)
+
+            except OSError as er:
+                print("Could not cache {}: {}".format(pa, er))
+
+        ar_ = da.values, da.index, da.columns
+
+    nu_ro_co, ro_al_, co_al_ = ar_
+
+    iero_ = _get_position(ro_al_, ro_)
+
+    ieco_ = _get_position(co_al_, co_)
+
+    if isinstance(iero_, slice) and isinstance(ieco_, slice):
+        nu_ro_co = asarray(nu_ro_co)
+
+    else:
+        nu_ro_co = asarray(nu_ro_co[iero_][:, ieco_])
+
+    return DataFrame(data=nu_ro_co, index=ro_al_[iero_], columns=co_al_[ieco_])
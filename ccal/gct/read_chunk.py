@@ -0,0 +1,66 @@
+from numpy import array, float64, nan
+from pandas import DataFrame, Index
+
+from ..path import open_text
+from .read import _read_column
+
+
+def _make_dataframe(ro_, nu__, na, co_, dt):
+    return DataFrame(
+        data=array(nu__, dtype=dt).reshape([len(ro_), len(co_)]),
+        index=Index(data=ro_, name=na),
+        columns=co_,
+    )
+
+
+def _parse_float(nu):
+    try:
+        return float(nu)
+
+    except ValueError:
+        return nan
+
+
+def _parse(nu, dt):
+    nu_ = nu.rstrip("\n").split(sep="\t")
+
+    try:
+        return array(nu_, dtype=dt)
+
+    except ValueError:
+        return array([_parse_float(nu) for nu in nu_], dtype=dt)
+
+
+def read_chunk(pa, ro_=None, fu=None, n_ro=int(1e4), dt=float64):
+    if ro_ is not None:
+        ro_ = set(ro_)
+
+    na, _, *co_ = _read_column(pa)
+
+    ros_ = []
+
+    nu__ = []
+
+    with open_text(pa) as io:
+        for _ in range(3):
+            io.readline()
+
+        for li in io:
+            ro, _, nu = li.split(sep="\t", maxsplit=2)
+
+            if (ro_ is not None and ro not in ro_) or (fu is not None and not fu(ro)):
+                continue
+
+            ros_.append(ro)
+
+            nu__.append(_parse(nu, dt))
+
+            if len(ros_) == n_ro:
+                yield _make_dataframe(ros_, nu__, na, co_, dt)
+
+                ros_ = []
+
+                nu__ = []
+
+    if 0 < len(ros_):
+        yield _make_dataframe(ros_, nu__, na, co_, dt)
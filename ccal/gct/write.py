@@ -0,0 +1,12 @@
+def write(pa, nu_ro_co, de_=None):
+    if de_ is None:
+        de_ = nu_ro_co.index
+
+    da = nu_ro_co.copy(deep=False)
+
+    da.insert(0, "Description", de_)
+
+    with open(pa, mode="w") as io:
+        io.write("#1.2\n{}\t{}\n".format(*nu_ro_co.shape))
+
+        da.to_csv(io, sep="\t", index_label="Name")
@@ -0,0 +1,30 @@
+from numpy import full, nan
+from scipy.spatial import Delaunay
+
+
+class Triangulation:
+    def __init__(self, no_po_di):
+        self.de = Delaunay(no_po_di)
+
+        self.ti__ = None
+
+        self.hu__ = None
+
+    def _make_line(self, ie_li_po):
+        po_li_po = full([ie_li_po.shape[0], ie_li_po.shape[1] + 1, 2], nan)
+
+        po_li_po[:, :-1] = self.de.points[ie_li_po]
+
+        return po_li_po.reshape([-1, 2]).T
+
+    def make_delaunay_triangulation(self):
+        if self.ti__ is None:
+            self.ti__ = self._make_line(self.de.simplices)
+
+        return self.ti__
+
+    def make_convex_hull(self):
+        if self.hu__ is None:
+            self.hu__ = self._make_line(self.de.convex_hull)
+
+        return self.hu__
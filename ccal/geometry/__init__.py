@@ -1,2 +1,3 @@
 from .make_convex_hull import make_convex_hull
 from .make_delaunay_triangulation import make_delaunay_triangulation
+from .Triangulation import Triangulation
@@ -0,0 +1,89 @@
+from sys import intern
+
+from numpy import array, int32, ones, zeros
+from pandas import DataFrame, Index, Series
+from scipy.sparse import csr_matrix
+from scipy.stats import hypergeom
+
+from ..significance import get_q_value
+
+
+class GeneSetCollection:
+    def __init__(self, se_ge_):
+        self.ge_ie = {}
+
+        iese_ = []
+
+        iege_ = []
+
+        for iese, ge_ in enumerate(se_ge_.values()):
+            for ge in dict.fromkeys(ge_):
+                iese_.append(iese)
+
+                iege_.append(self.ge_ie.setdefault(intern(str(ge)), len(self.ge_ie)))
+
+        self.se_ = Index(data=list(se_ge_), name="Gene Set")
+
+        self.ge_ = array(list(self.ge_ie), dtype=object)
+
+        self.me_se_ge = csr_matrix(
+            (ones(len(iese_), dtype=int32), (iese_, iege_)),
+            shape=[self.se_.size, self.ge_.size],
+        )
+
+        self.me_ge_se = self.me_se_ge.T.tocsr()
+
+        self.n_ge_ = self.me_se_ge.getnnz(axis=1)
+
+    def _encode(self, ge_):
+        ve = zeros(self.ge_.size, dtype=int32)
+
+        ve[[self.ge_ie[ge] for ge in set(ge_) if ge in self.ge_ie]] = 1
+
+        return ve
+
+    def get_set(self, ge):
+        if ge not in self.ge_ie:
+            return []
+
+        ie = self.ge_ie[ge]
+
+        return self.se_[
+            self.me_ge_se.indices[
+                self.me_ge_se.indptr[ie] : self.me_ge_se.indptr[ie + 1]
+            ]
+        ].tolist()
+
+    def count_overlap(self, ge_):
+        return Series(
+            data=self.me_se_ge @ self._encode(ge_), index=self.se_, name="Overlap"
+        )
+
+    def get_jaccard(self, ge_):
+        ov_ = self.me_se_ge @ self._encode(ge_)
+
+        return Series(
+            data=ov_ / (self.n_ge_ + len(set(ge_)) - ov_),
+            index=self.se_,
+            name="Jaccard",
+        )
+
+    def test_hypergeometric(self, ge_, n_un=None):
+        ve = self._encode(ge_)
+
+        if n_un is None:
+            n_un = self.ge_.size
+
+        ov_ = self.me_se_ge @ ve
+
+        pv_ = hypergeom.sf(ov_ - 1, n_un, self.n_ge_, ve.sum())
+
+        return DataFrame(
+            data={
+                "Overlap": ov_,
+                "Size": self.n_ge_,
+                "P-Value": pv_,
+                "Q-Value": get_q_value(pv_),
+            },
+            index=self.se_,
+        )
@@ -1 +1,2 @@
+from .GeneSetCollection import GeneSetCollection
 from .read import read
@@ -1,11 +1,30 @@
+from multiprocessing import Pool
+from os.path import basename, exists
+from sys import intern
+
+from numpy import (
+    array,
+    concatenate,
+    cumsum,
+    frombuffer,
+    int32,
+    int64,
+    load,
+    savez,
+    uint8,
+)
+
+from ..path import get_stamp
+
+
 def _read(pa):
-    se_ge_ = {}
+    se_ge__ = []
 
     with open(pa) as io:
-        for li in io.readlines():
+        for li in io:
             sp_ = li.strip().split(sep="\t")
 
-            ge_ = [sp for sp in sp_[2:] if sp != ""]
+            ge_ = [intern(sp) for sp in sp_[2:] if sp != ""]
 
             se = sp_[0]
 
@@ -13,15 +32,113 @@ def _read(pa):
                 print("{} has 0 gene.".format(se))
 
             else:
-                se_ge_[se] = ge_
+                se_ge__.append((se, ge_))
 
-    return se_ge_
+    return se_ge__
+
+
+def _report(du__, du):
+    for se, pa in du__:
+        print("{} in {} is duplicated ({}).".format(se, pa, du))
+
+
+def _encode(st_):
+    return frombuffer("\n".join(st_).encode(), dtype=uint8)
+
+
+def _decode(by_):
+    return by_.tobytes().decode().split(sep="\n")
+
+
+def _write_cache(pac, pa_, du, se_ge_, du__):
+    ge_ie = {}
+
+    ie_ = [[ge_ie.setdefault(ge, len(ge_ie)) for ge in ge_] for ge_ in se_ge_.values()]
+
+    with open(pac, mode="wb") as io:
+        savez(
+            io,
+            pa_=_encode(pa_),
+            du=du,
+            du__=_encode("{}\t{}".format(se, pa) for se, pa in du__),
+            st_=array([get_stamp(pa) for pa in pa_], dtype=int64),
+            se_=_encode(se_ge_),
+            ge_=_encode(ge_ie),
+            po_=concatenate([[0], cumsum([len(ie) for ie in ie_])]),
+            ie_=array([ie for iese_ in ie_ for ie in iese_], dtype=int32),
+        )
+
+
+def _read_cache(pac, pa_, du):
+    with load(pac) as nz:
+        if (
+            _decode(nz["pa_"]) != list(pa_)
+            or nz["st_"].tolist() != [get_stamp(pa) for pa in pa_]
+            or str(nz["du"]) != du
+        ):
+            return None
+
+        _report([li.split(sep="\t") for li in _decode(nz["du__"]) if li != ""], du)
+
+        ge_ = [intern(ge) for ge in _decode(nz["ge_"])]
 
+        po_ = nz["po_"].tolist()
+
+        ie_ = nz["ie_"].tolist()
+
+        return {
+            se: [ge_[ie] for ie in ie_[po_[iese] : po_[iese + 1]]]
+            for iese, se in enumerate(_decode(nz["se_"]))
+        }
+
+
+def read(pa_, du="last", n_jo=1, pac=None):
+    if pac is not None and exists(pac):
+        se_ge_ = _read_cache(pac, pa_, du)
+
+        if se_ge_ is not None:
+            return se_ge_
+
+    po = Pool(processes=n_jo)
+
+    sege__ = po.map(_read, pa_)
+
+    po.terminate()
 
-def read(pa_):
     se_ge_ = {}
 
-    for pa in pa_:
-        se_ge_.update(_read(pa))
+    du__ = []
+
+    for pa, se_ge__ in zip(pa_, sege__):
+        for se, ge_ in se_ge__:
+            ge_ = [intern(ge) for ge in ge_]
+
+            if se in se_ge_:
+                du__.append((se, pa))
+
+                if du == "first":
+                    continue
+
+                elif du == "union":
+                    ge_ = list(dict.fromkeys(se_ge_[se] + ge_))
+
+                elif du == "rename":
+                    ser = "{} ({})".format(se, basename(pa))
+
+                    ie = 1
+
+                    while ser in se_ge_:
+                        ie += 1
+
+                        ser = "{} ({} {})".format(se, basename(pa), ie)
+
+                    se = ser
+
+            se_ge_[se] = ge_
+
+    _report(du__, du)
+
+    if pac is not None:
+        _write_cache(pac, pa_, du, se_ge_, du__)
 
     return se_ge_
@@ -1,22 +1,28 @@
-from numpy import full, mean, nan, unique
+from multiprocessing.pool import ThreadPool
+
+from numpy import array, empty, mean, nan, rint, unique
 from pandas import DataFrame
-from scipy.spatial import Delaunay
 
 from ..constant import RANDOM_SEED
 from ..density import get_bandwidth
-from ..grid import make_1d_grid
+from ..geometry import Triangulation
+from ..grid import make_1d_grid, make_nd_grid
 from ..plot import NAME_COLORSCALE, plot_heat_map
 from ..point import plot, pull, scale
 from ..probability import get_probability
 
+DEFAULT = {"ex": 1, "ba": None, "tr": None, "ou_co_co": None}
+
 
 class GPSMap:
-    def __init__(self, di_no_no, nu_po_no, ra=RANDOM_SEED):
-        self.nu_no_di = scale(di_no_no, 2, ra=ra)
+    def __init__(self, di_no_no, nu_po_no, ra=RANDOM_SEED, ex=1, **ke_ar):
+        self.nu_no_di = scale(di_no_no, 2, ra=ra, **ke_ar)
 
         self.nu_po_no = nu_po_no
 
-        self.nu_po_di = pull(self.nu_no_di, self.nu_po_no.values)
+        self.ex = ex
+
+        self.nu_po_di = pull(self.nu_no_di, self.nu_po_no.values, ex=self.ex)
 
         self.gr_ = None
 
@@ -28,6 +34,33 @@ class GPSMap:
 
         self.colorscaleg = None
 
+        self.ba = None
+
+        self.tr = None
+
+        self.ou_co_co = None
+
+    def __getattr__(self, na):
+        lo_ = self.__dict__.get("lo_", {})
+
+        if na in lo_:
+            setattr(self, na, lo_.pop(na)())
+
+            return self.__dict__[na]
+
+        if na in DEFAULT:
+            setattr(self, na, DEFAULT[na])
+
+            return self.__dict__[na]
+
+        raise AttributeError(na)
+
+    def _get_triangulation(self):
+        if self.tr is None:
+            self.tr = Triangulation(self.nu_no_di)
+
+        return self.tr
+
     def plot(self, **ke_ar):
         if "po_sc" in ke_ar:
             gr_ = None
@@ -43,10 +76,13 @@ class GPSMap:
             co_=self.co_,
             bap_=self.bap_,
             bag_=self.bag_,
+            tr=self._get_triangulation(),
             **ke_ar,
         )
 
-    def set_group(self, gr_, colorscale=NAME_COLORSCALE["categorical"], n_co=128):
+    def set_group(
+        self, gr_, colorscale=NAME_COLORSCALE["categorical"], n_co=128, n_jo=1, pl=True
+    ):
         if isinstance(gr_, str) and gr_ == "closest_node":
             gr_ = self.nu_po_no.values.argmax(axis=1) + 1
 
@@ -56,65 +92,102 @@ class GPSMap:
 
         sh = [n_co] * 2
 
-        ma = full(sh, nan)
-
-        de = Delaunay(self.nu_no_di)
+        if self.ou_co_co is None or self.co_.size != n_co:
+            self.co_ = make_1d_grid(0, 1, 1e-3, n_co)
 
-        self.co_ = make_1d_grid(0, 1, 1e-3, n_co)
+            de = self._get_triangulation().de
 
-        for ie1 in range(n_co):
-            for ie2 in range(n_co):
-                ma[ie1, ie2] = de.find_simplex([self.co_[ie1], self.co_[ie2]])
+            self.ou_co_co = (
+                de.find_simplex(make_nd_grid([self.co_] * 2)).reshape(sh) == -1
+            )
 
-        gr_bap_ = {}
-
-        ba = mean(get_bandwidth(self.nu_po_di, me="silverman"))
+        if self.ba is None:
+            self.ba = mean(get_bandwidth(self.nu_po_di, me="silverman"))
 
         co__ = [self.co_] * 2
 
-        for gr in unique(self.gr_):
-            gr_bap_[gr] = get_probability(
-                self.nu_po_di[self.gr_ == gr], co__=co__, pl=False, bw=ba
+        def _get_probability(gr):
+            return get_probability(
+                self.nu_po_di[self.gr_ == gr], co__=co__, pl=False, bw=self.ba
             )[1].reshape(sh)
 
-        self.bap_ = full(sh, nan)
-
-        self.bag_ = full(sh, 0, dtype=int)
+        gr_ = unique(self.gr_)
 
-        for ie1 in range(n_co):
-            for ie2 in range(n_co):
-                if ma[ie1, ie2] != -1:
-                    prb = 0.0
+        po = ThreadPool(processes=n_jo)
 
-                    grb = 0
+        pr_gr_co_co = array(po.map(_get_probability, gr_))
 
-                    for gr, bap_ in gr_bap_.items():
-                        pr = bap_[ie1, ie2]
+        po.terminate()
 
-                        if prb < pr:
-                            prb = pr
+        self.bap_ = pr_gr_co_co.max(axis=0)
 
-                            grb = gr
+        self.bag_ = gr_[pr_gr_co_co.argmax(axis=0)].astype(int)
 
-                    self.bap_[ie1, ie2] = prb
+        self.bap_[self.ou_co_co] = nan
 
-                    self.bag_[ie1, ie2] = grb
+        self.bag_[self.ou_co_co] = 0
 
-        plot_heat_map(
-            self.nu_po_no.T,
-            gr2_=self.gr_,
-            colorscale2=self.colorscaleg,
-            layout={"yaxis": {"dtick": 1}},
-        )
+        if pl:
+            plot_heat_map(
+                self.nu_po_no.T,
+                gr2_=self.gr_,
+                colorscale2=self.colorscaleg,
+                layout={"yaxis": {"dtick": 1}},
+            )
 
     def predict(self, nap, po_, nu_po_no, **ke_ar):
         plot(
             DataFrame(data=self.nu_no_di, index=self.nu_po_no.columns),
-            DataFrame(data=pull(self.nu_no_di, nu_po_no.values), index=nu_po_no.index),
+            DataFrame(
+                data=pull(self.nu_no_di, nu_po_no.values, ex=self.ex),
+                index=nu_po_no.index,
+            ),
             gr_=None,
             colorscaleg=self.colorscaleg,
             co_=self.co_,
             bap_=self.bap_,
             bag_=self.bag_,
+            tr=self._get_triangulation(),
             **ke_ar,
         )
+
+    def classify(self, nu_po_no, n_ch=int(1e5)):
+        assert self.bag_ is not None
+
+        if isinstance(nu_po_no, DataFrame):
+            nu_po_no = nu_po_no.values
+
+        n_po = nu_po_no.shape[0]
+
+        cl_ = empty(
+            n_po,
+            dtype=[
+                ("Coordinate 1", "f4"),
+                ("Coordinate 2", "f4"),
+                ("Group", "i4"),
+                ("Probability", "f4"),
+            ],
+        )
+
+        lo = self.co_[0]
+
+        re = self.co_[1] - lo
+
+        n_co = self.co_.size
+
+        for ie in range(0, n_po, n_ch):
+            nu_po_di = pull(self.nu_no_di, nu_po_no[ie : ie + n_ch], ex=self.ex)
+
+            ie1_, ie2_ = rint((nu_po_di - lo) / re).astype(int).clip(0, n_co - 1).T
+
+            cl_ch = cl_[ie : ie + n_ch]
+
+            cl_ch["Coordinate 1"] = nu_po_di[:, 0]
+
+            cl_ch["Coordinate 2"] = nu_po_di[:, 1]
+
+            cl_ch["Group"] = self.bag_[ie1_, ie2_]
+
+            cl_ch["Probability"] = self.bap_[ie1_, ie2_]
+
+        return cl_
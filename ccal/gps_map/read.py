@@ -1,7 +1,56 @@
+from functools import partial
 from gzip import open as gzip_open
-from pickle import load
+from json import load
+from os.path import exists, isdir, join
+from pickle import load as pickle_load
+
+from numpy import load as numpy_load
+from pandas import DataFrame, Index
+
+from .GPSMap import GPSMap
+
+
+def _read_array(pa):
+    if exists(pa):
+        return numpy_load(pa, mmap_mode="r")
+
+
+def _read_nu_po_no(pa, po, no):
+    return DataFrame(
+        data=_read_array(join(pa, "nu_po_no.npy")),
+        index=Index(data=_read_array(join(pa, "po_.npy")), name=po),
+        columns=Index(data=_read_array(join(pa, "no_.npy")), name=no),
+        copy=False,
+    )
 
 
 def read(pa):
-    with gzip_open(pa) as io:
-        return load(io)
+    if isdir(pa):
+        with open(join(pa, "gps_map.json")) as io:
+            js = load(io)
+
+        gp = GPSMap.__new__(GPSMap)
+
+        for na in ["nu_no_di", "gr_", "co_", "bap_", "bag_"]:
+            setattr(gp, na, _read_array(join(pa, "{}.npy".format(na))))
+
+        gp.ex = js["ex"]
+
+        gp.colorscaleg = js["colorscaleg"]
+
+        gp.ba = js["ba"]
+
+        gp.tr = None
+
+        gp.ou_co_co = None
+
+        gp.lo_ = {
+            "nu_po_no": partial(_read_nu_po_no, pa, js["po"], js["no"]),
+            "nu_po_di": partial(_read_array, join(pa, "nu_po_di.npy")),
+        }
+
+        return gp
+
+    else:
+        with gzip_open(pa) as io:
+            return pickle_load(io)
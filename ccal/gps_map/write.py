@@ -1,7 +1,52 @@
 from gzip import open as gzip_open
-from pickle import dump
+from json import dump
+from os import makedirs, replace
+from os.path import join
+from pickle import dump as pickle_dump
 
+from numpy import asarray, save
 
-def write(pa, gp):
-    with gzip_open(pa, mode="wb") as io:
-        dump(gp, io)
+
+def _save(pa, ar):
+    pat = "{}.tmp".format(pa)
+
+    with open(pat, mode="wb") as io:
+        save(io, ar)
+
+    replace(pat, pa)
+
+
+def write(pa, gp, fo="pickle"):
+    if fo == "pickle":
+        with gzip_open(pa, mode="wb") as io:
+            pickle_dump(gp, io)
+
+    elif fo == "npy":
+        makedirs(pa, exist_ok=True)
+
+        for na in ["nu_no_di", "nu_po_di", "gr_", "co_", "bap_", "bag_"]:
+            an = getattr(gp, na)
+
+            if an is not None:
+                _save(join(pa, "{}.npy".format(na)), asarray(an))
+
+        nu_po_no = gp.nu_po_no
+
+        _save(join(pa, "nu_po_no.npy"), nu_po_no.values)
+
+        _save(join(pa, "po_.npy"), nu_po_no.index.values.astype(str))
+
+        _save(join(pa, "no_.npy"), nu_po_no.columns.values.astype(str))
+
+        with open(join(pa, "gps_map.json"), mode="w") as io:
+            dump(
+                {
+                    "ex": gp.ex,
+                    "colorscaleg": gp.colorscaleg,
+                    "ba": gp.ba,
+                    "po": nu_po_no.index.name,
+                    "no": nu_po_no.columns.name,
+                },
+                io,
+                indent=2,
+            )
@@ -1,5 +1,7 @@
 from .factorize import factorize
+from .factorize_online import factorize_online
 from .factorize_with_nmf import factorize_with_nmf
 from .make_label import make_label
 from .plot import plot
 from .solve import solve
+from .sweep import sweep
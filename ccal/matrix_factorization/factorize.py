@@ -1,6 +1,24 @@
-from numpy import absolute, array, sqrt, sum
-from numpy.linalg import norm
+from os import replace
+from os.path import exists
+
+from numpy import (
+    absolute,
+    allclose,
+    array,
+    array_equal,
+    asarray,
+    dot,
+    einsum,
+    empty,
+    float64,
+    full,
+    load,
+    nan,
+    savez,
+    sqrt,
+)
 from numpy.random import default_rng
+from scipy.sparse import issparse
 
 from ..constant import FLOAT_RESOLUTION, RANDOM_SEED
 
@@ -12,98 +30,402 @@ def _initialize(sy, ma, re, rn):
     elif sy == "h":
         si = [re, ma.shape[1]]
 
-    return absolute(rn.standard_normal(size=si)) * sqrt(ma.mean() / re)
+    mai = absolute(rn.standard_normal(size=si)).astype(ma.dtype)
+
+    mai *= sqrt(ma.mean() / re)
+
+    return mai
 
 
 def _clip(ma):
     ma[ma < FLOAT_RESOLUTION] = 0
 
 
-def _update_w(ma, maw, mah):
-    return maw * (ma @ mah.T) / (maw @ mah @ mah.T)
+def _cast(ma, dt):
+    if issparse(ma):
+        return ma.astype(dt).tocsr()
+
+    else:
+        return asarray(ma, dtype=dt)
+
+
+def _multiply(ma1, ma2, ou):
+    if issparse(ma1) or issparse(ma2):
+        ou[:] = ma1 @ ma2
+
+    else:
+        dot(ma1, ma2, out=ou)
+
+
+def _get_inner(ma1, ma2):
+    return einsum("ij,ij", ma1, ma2, dtype=float64)
+
+
+def _get_square_sum(ma):
+    if issparse(ma):
+        da = ma.data.astype(float64)
+
+        return da @ da
+
+    else:
+        return _get_inner(ma, ma)
+
 
+def _get_error(ss, tr, maww, mahh):
+    return sqrt(max(ss - 2 * tr + _get_inner(maww, mahh), 0))
 
-def _update_h(ma, maw, mah):
-    return mah * (maw.T @ ma) / (maw.T @ maw @ mah)
 
+def _get_error_float64(ss, ma, maw, mah):
+    maw = maw.astype(float64)
 
-def _check_tolerable(er_it_ie, to):
-    er2_, er1_ = array(er_it_ie)[-2:]
+    mah = mah.astype(float64)
 
+    n_ro = max(1, int(1e6) // ma.shape[1])
+
+    tr = sum(
+        _get_inner(maw[ie : ie + n_ro], _cast(ma[ie : ie + n_ro], float64) @ mah.T)
+        for ie in range(0, ma.shape[0], n_ro)
+    )
+
+    return _get_error(ss, tr, maw.T @ maw, mah @ mah.T)
+
+
+def _check_tolerable(er2_, er1_, to):
     return ((er2_ - er1_) / er2_ <= to).all()
 
 
-def factorize(ma_, me, re, we_=None, to=1e-6, n_it=int(1e3), ra=RANDOM_SEED):
+def _write(pa, maw_, mah_, er_it_ie, it, co, fi):
+    pat = "{}.tmp".format(pa)
+
+    with open(pat, mode="wb") as io:
+        savez(
+            io,
+            it=it,
+            er_it_ie=er_it_ie,
+            co=co,
+            **fi,
+            **{"w{}".format(ie): maw for ie, maw in enumerate(maw_)},
+            **{"h{}".format(ie): mah for ie, mah in enumerate(mah_)},
+        )
+
+    replace(pat, pa)
+
+
+def _read(pa):
+    with load(pa) as nz:
+        ke_ = nz.files
+
+        return (
+            [nz["w{}".format(ie)] for ie in range(sum(ke[0] == "w" for ke in ke_))],
+            [nz["h{}".format(ie)] for ie in range(sum(ke[0] == "h" for ke in ke_))],
+            nz["er_it_ie"],
+            int(nz["it"]),
+            bool(nz["co"]),
+            {ke: nz[ke] for ke in ["me", "re", "sh_", "ss_"]},
+        )
+
+
+def _check_fingerprint(fi1, fi2):
+    return (
+        str(fi1["me"]) == str(fi2["me"])
+        and int(fi1["re"]) == int(fi2["re"])
+        and array_equal(fi1["sh_"], fi2["sh_"])
+        and allclose(fi1["ss_"], fi2["ss_"], rtol=1e-6)
+    )
+
+
+def factorize(
+    ma_,
+    me,
+    re,
+    we_=None,
+    to=1e-6,
+    n_it=int(1e3),
+    ra=RANDOM_SEED,
+    n_ch=None,
+    dt=float64,
+    maw_=None,
+    mah_=None,
+    pa=None,
+    n_wr=100,
+):
+    ma_ = [_cast(ma, dt) for ma in ma_]
+
+    if n_ch is None:
+        if ma_[0].dtype == float64:
+            n_ch = 1
+
+        else:
+            n_ch = 10
+
     for ma in ma_:
         assert 0 <= ma.min()
 
-    if we_ is None:
-        si = ma_[0].size
+    si_ = [ma.shape[0] * ma.shape[1] for ma in ma_]
 
-        we_ = [si / ma.size for ma in ma_]
+    if we_ is None:
+        we_ = [si_[0] / si for si in si_]
 
     n_ie = len(ma_)
 
+    ss_ = [_get_square_sum(ma) for ma in ma_]
+
+    fi = {
+        "me": me,
+        "re": re,
+        "sh_": array([ma.shape for ma in ma_]),
+        "ss_": array(ss_),
+    }
+
+    if pa is not None and exists(pa):
+        maw_, mah_, er_it_ie0, it0, co, fi0 = _read(pa)
+
+        assert _check_fingerprint(fi, fi0), "{} is from a different run".format(pa)
+
+        if co:
+            print("{} has converged".format(pa))
+
+            return (
+                [array(maw, dtype=dt) for maw in maw_],
+                [array(mah, dtype=dt) for mah in mah_],
+                er_it_ie0.T,
+            )
+
+        print("Resuming from {} (overriding maw_ and mah_)".format(pa))
+
+        ie_er = er_it_ie0.shape[0]
+
+    else:
+        ie_er = 0
+
+        it0 = 0
+
+    er_it_ie = full([ie_er + (n_it - it0) // n_ch + 2, n_ie], nan)
+
+    if 0 < ie_er:
+        er_it_ie[:ie_er] = er_it_ie0
+
     rn = default_rng(seed=ra)
 
+    mak = empty([re, re], dtype=dt)
+
+    it = it0 - 1
+
+    co = False
+
     if me == "deep":
-        maw_ = [_initialize("w", ma, re, rn) for ma in ma_]
+        if maw_ is None:
+            maw_ = [_initialize("w", ma, re, rn) for ma in ma_]
 
-        mah = _initialize("h", ma_[0], re, rn)
+        else:
+            maw_ = [array(maw, dtype=dt) for maw in maw_]
 
-        er_it_ie = [[norm(ma_[ie] - maw_[ie] @ mah) for ie in range(n_ie)]]
+        if mah_ is None:
+            mah = _initialize("h", ma_[0], re, rn)
 
-        for _ in range(n_it):
-            nu = sum([we_[ie] * maw_[ie].T @ ma_[ie] for ie in range(n_ie)], axis=0)
+        else:
+            mah = array(mah_[0], dtype=dt)
 
-            de = sum(
-                [we_[ie] * maw_[ie].T @ maw_[ie] @ mah for ie in range(n_ie)], axis=0
-            )
+        nu = empty(mah.shape, dtype=dt)
+
+        de = empty(mah.shape, dtype=dt)
+
+        bu = empty(mah.shape, dtype=dt)
+
+        mahh = mah @ mah.T
+
+        maah_ = [ma @ mah.T for ma in ma_]
+
+        bu_ = [empty(maw.shape, dtype=dt) for maw in maw_]
+
+        if ie_er == 0:
+            er_it_ie[0] = [
+                _get_error_float64(ss_[ie], ma_[ie], maw_[ie], mah)
+                for ie in range(n_ie)
+            ]
+
+            ie_er = 1
+
+        for it in range(it0, n_it):
+            nu.fill(0)
+
+            de.fill(0)
+
+            for ie in range(n_ie):
+                maw = maw_[ie]
+
+                _multiply(maw.T, ma_[ie], bu)
+
+                bu *= we_[ie]
 
-            mah *= nu / de
+                nu += bu
+
+                dot(maw.T, maw, out=mak)
+
+                mak *= we_[ie]
+
+                dot(mak, mah, out=bu)
+
+                de += bu
+
+            mah *= nu
+
+            mah /= de
 
             _clip(mah)
 
-            maw_ = [_update_w(ma_[ie], maw_[ie], mah) for ie in range(n_ie)]
+            dot(mah, mah.T, out=mahh)
+
+            for ie in range(n_ie):
+                maw = maw_[ie]
+
+                _multiply(ma_[ie], mah.T, maah_[ie])
+
+                dot(maw, mahh, out=bu_[ie])
+
+                maw *= maah_[ie]
+
+                maw /= bu_[ie]
+
+                _clip(maw)
 
-            for ma in maw_:
-                _clip(ma)
+            if (it + 1) % n_ch == 0 or it + 1 == n_it:
+                for ie in range(n_ie):
+                    maw = maw_[ie]
 
-            er_it_ie.append([norm(ma_[ie] - maw_[ie] @ mah) for ie in range(n_ie)])
+                    if ma_[ie].dtype == float64:
+                        dot(maw.T, maw, out=mak)
 
-            if _check_tolerable(er_it_ie, to):
-                break
+                        er_it_ie[ie_er, ie] = _get_error(
+                            ss_[ie], _get_inner(maw, maah_[ie]), mak, mahh
+                        )
+
+                    else:
+                        er_it_ie[ie_er, ie] = _get_error_float64(
+                            ss_[ie], ma_[ie], maw, mah
+                        )
+
+                ie_er += 1
+
+                if _check_tolerable(
+                    er_it_ie[ie_er - 2], er_it_ie[ie_er - 1], to * n_ch
+                ):
+                    co = True
+
+                    break
+
+            if pa is not None and (it + 1) % n_wr == 0:
+                _write(pa, maw_, [mah], er_it_ie[:ie_er], it + 1, co, fi)
 
         mah_ = [mah]
 
     elif me == "wide":
-        maw = _initialize("w", ma_[0], re, rn)
+        if maw_ is None:
+            maw = _initialize("w", ma_[0], re, rn)
 
-        mah_ = [_initialize("h", ma, re, rn) for ma in ma_]
+        else:
+            maw = array(maw_[0], dtype=dt)
 
-        er_it_ie = [[norm(ma_[ie] - maw @ mah_[ie]) for ie in range(n_ie)]]
+        if mah_ is None:
+            mah_ = [_initialize("h", ma, re, rn) for ma in ma_]
 
-        for _ in range(n_it):
-            nu = sum([we_[ie] * ma_[ie] @ mah_[ie].T for ie in range(n_ie)], axis=0)
+        else:
+            mah_ = [array(mah, dtype=dt) for mah in mah_]
 
-            de = sum(
-                [we_[ie] * maw @ mah_[ie] @ mah_[ie].T for ie in range(n_ie)], axis=0
-            )
+        nu = empty(maw.shape, dtype=dt)
+
+        de = empty(maw.shape, dtype=dt)
+
+        bu = empty(maw.shape, dtype=dt)
+
+        maww = maw.T @ maw
+
+        mawa_ = [maw.T @ ma for ma in ma_]
+
+        bu_ = [empty(mah.shape, dtype=dt) for mah in mah_]
+
+        if ie_er == 0:
+            er_it_ie[0] = [
+                _get_error_float64(ss_[ie], ma_[ie], maw, mah_[ie])
+                for ie in range(n_ie)
+            ]
 
-            maw *= nu / de
+            ie_er = 1
+
+        for it in range(it0, n_it):
+            nu.fill(0)
+
+            de.fill(0)
+
+            for ie in range(n_ie):
+                mah = mah_[ie]
+
+                _multiply(ma_[ie], mah.T, bu)
+
+                bu *= we_[ie]
+
+                nu += bu
+
+                dot(mah, mah.T, out=mak)
+
+                mak *= we_[ie]
+
+                dot(maw, mak, out=bu)
+
+                de += bu
+
+            maw *= nu
+
+            maw /= de
 
             _clip(maw)
 
-            mah_ = [_update_h(ma_[ie], maw, mah_[ie]) for ie in range(n_ie)]
+            dot(maw.T, maw, out=maww)
 
-            for ma in mah_:
-                _clip(ma)
+            for ie in range(n_ie):
+                mah = mah_[ie]
 
-            er_it_ie.append([norm(ma_[ie] - maw @ mah_[ie]) for ie in range(n_ie)])
+                _multiply(maw.T, ma_[ie], mawa_[ie])
 
-            if _check_tolerable(er_it_ie, to):
-                break
+                dot(maww, mah, out=bu_[ie])
+
+                mah *= mawa_[ie]
+
+                mah /= bu_[ie]
+
+                _clip(mah)
+
+            if (it + 1) % n_ch == 0 or it + 1 == n_it:
+                for ie in range(n_ie):
+                    mah = mah_[ie]
+
+                    if ma_[ie].dtype == float64:
+                        dot(mah, mah.T, out=mak)
+
+                        er_it_ie[ie_er, ie] = _get_error(
+                            ss_[ie], _get_inner(mah, mawa_[ie]), maww, mak
+                        )
+
+                    else:
+                        er_it_ie[ie_er, ie] = _get_error_float64(
+                            ss_[ie], ma_[ie], maw, mah
+                        )
+
+                ie_er += 1
+
+                if _check_tolerable(
+                    er_it_ie[ie_er - 2], er_it_ie[ie_er - 1], to * n_ch
+                ):
+                    co = True
+
+                    break
+
+            if pa is not None and (it + 1) % n_wr == 0:
+                _write(pa, [maw], mah_, er_it_ie[:ie_er], it + 1, co, fi)
 
         maw_ = [maw]
 
-    return maw_, mah_, array(er_it_ie).T
+    if pa is not None:
+        _write(pa, maw_, mah_, er_it_ie[:ie_er], it + 1, co, fi)
+
+    return maw_, mah_, er_it_ie[:ie_er].T
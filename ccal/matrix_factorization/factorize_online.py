@@ -0,0 +1,104 @@
+from numpy import array, concatenate, empty, float64, zeros
+from numpy.random import default_rng
+
+from ..constant import RANDOM_SEED
+from .factorize import (
+    _cast,
+    _clip,
+    _get_error,
+    _get_inner,
+    _get_square_sum,
+    _initialize,
+    _multiply,
+)
+
+
+def _iterate(ma, n_bl):
+    for ie in range(0, ma.shape[1], n_bl):
+        yield ma[:, ie : ie + n_bl]
+
+
+def factorize_online(
+    ma, re, n_bl=int(1e4), n_ep=1, n_it=100, fo=0.7, dt=float64, ra=RANDOM_SEED
+):
+    if not hasattr(ma, "shape"):
+        n_ep = 1
+
+    rn = default_rng(seed=ra)
+
+    maw = None
+
+    maww = empty([re, re], dtype=dt)
+
+    er_ = []
+
+    for _ in range(n_ep):
+        mah_ = []
+
+        if hasattr(ma, "shape"):
+            bl_ = _iterate(ma, n_bl)
+
+        else:
+            bl_ = ma
+
+        for bl in bl_:
+            bl = _cast(bl, dt)
+
+            assert 0 <= bl.min()
+
+            if maw is None:
+                maw = _initialize("w", bl, re, rn)
+
+                maa = zeros([re, re], dtype=dt)
+
+                mab = zeros(maw.shape, dtype=dt)
+
+                bu = empty(maw.shape, dtype=dt)
+
+            mahb = _initialize("h", bl, re, rn)
+
+            mawa = empty(mahb.shape, dtype=dt)
+
+            buh = empty(mahb.shape, dtype=dt)
+
+            _multiply(maw.T, bl, mawa)
+
+            maww[:] = maw.T @ maw
+
+            for _ in range(n_it):
+                maww.dot(mahb, out=buh)
+
+                mahb *= mawa
+
+                mahb /= buh
+
+                _clip(mahb)
+
+            mahh = mahb @ mahb.T
+
+            er_.append(
+                _get_error(_get_square_sum(bl), _get_inner(mahb, mawa), maww, mahh)
+            )
+
+            maa *= fo
+
+            maa += mahh
+
+            mab *= fo
+
+            _multiply(bl, mahb.T, bu)
+
+            mab += bu
+
+            for _ in range(n_it):
+                maw.dot(maa, out=bu)
+
+                maw *= mab
+
+                maw /= bu
+
+                _clip(maw)
+
+            mah_.append(mahb)
+
+    return [maw], [concatenate(mah_, axis=1)], array([er_])
@@ -1,21 +1,123 @@
-from numpy import dot, full, nan
-from numpy.linalg import pinv
+from functools import lru_cache
+from multiprocessing import Pool
+
+from numpy import (
+    absolute,
+    array_split,
+    concatenate,
+    dot,
+    frombuffer,
+    full,
+    ix_,
+    unique,
+    where,
+    zeros,
+)
+from numpy.linalg import lstsq, norm, pinv
 from pandas import DataFrame
-from scipy.optimize import nnls
 
+from ..constant import FLOAT_RESOLUTION
+
+
+@lru_cache(maxsize=8)
+def _get_pinv(by, sh, dt):
+    return pinv(frombuffer(by, dtype=dt).reshape(sh))
+
+
+def _solve_passive(magg, maab, pa_fa_co, mas, magr, ie_):
+    un_fa_co, un_ = unique(pa_fa_co[:, ie_].T, axis=0, return_inverse=True)
+
+    for ieu, pa_ in enumerate(un_fa_co):
+        ieu_ = ie_[un_ == ieu]
+
+        mau = zeros([pa_.size, ieu_.size])
+
+        if pa_.any():
+            mau[pa_] = lstsq(magg[ix_(pa_, pa_)], maab[ix_(pa_, ieu_)], rcond=None)[0]
+
+        mas[:, ieu_] = mau
+
+        magr[:, ieu_] = magg @ mau - maab[:, ieu_]
+
+        magr[ix_(pa_, ieu_)] = 0
+
+
+def _solve_block(magg, maab):
+    n_fa, n_co = maab.shape
+
+    pa_fa_co = zeros(maab.shape, dtype=bool)
+
+    mas = zeros(maab.shape)
+
+    magr = -maab
+
+    al_ = full(n_co, 3)
+
+    be_ = full(n_co, n_fa + 1)
+
+    no = norm(magg, 1)
 
-def solve(daa, dab, me):
+    while True:
+        to_ = (
+            10
+            * FLOAT_RESOLUTION
+            * n_fa
+            * (no * absolute(mas).max(axis=0) + absolute(maab).max(axis=0))
+        )
+
+        in_fa_co = (pa_fa_co & (mas < 0)) | (~pa_fa_co & (magr < -to_))
+
+        n_in_ = in_fa_co.sum(axis=0)
+
+        ch_ = 0 < n_in_
+
+        if not ch_.any():
+            break
+
+        fu_ = ch_ & (n_in_ < be_)
+
+        be_[fu_] = n_in_[fu_]
+
+        al_[fu_] = 3
+
+        ba_ = ch_ & ~fu_ & (0 < al_)
+
+        al_[ba_] -= 1
+
+        fu_ |= ba_
+
+        pa_fa_co[:, fu_] ^= in_fa_co[:, fu_]
+
+        on_ = ch_ & ~fu_
+
+        pa_fa_co[n_fa - 1 - in_fa_co[::-1, on_].argmax(axis=0), on_] ^= True
+
+        _solve_passive(magg, maab, pa_fa_co, mas, magr, where(ch_)[0])
+
+    return mas
+
+
+def solve(daa, dab, me, n_jo=1):
     maa = daa.values
 
     mab = dab.values
 
     if me == "pinv":
-        mas = dot(pinv(maa), mab)
+        mas = dot(_get_pinv(maa.tobytes(), maa.shape, maa.dtype.str), mab)
 
     elif me == "nnls":
-        mas = full([daa.shape[1], dab.shape[1]], nan)
+        magg = maa.T @ maa
+
+        po = Pool(processes=n_jo)
+
+        mas = concatenate(
+            po.starmap(
+                _solve_block,
+                ([magg, maab] for maab in array_split(maa.T @ mab, n_jo, axis=1)),
+            ),
+            axis=1,
+        )
 
-        for ie in range(dab.shape[1]):
-            mas[:, ie] = nnls(maa, mab[:, ie])[0]
+        po.terminate()
 
     return DataFrame(data=mas, index=daa.columns, columns=dab.columns)
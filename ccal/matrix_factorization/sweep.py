@@ -0,0 +1,94 @@
+from multiprocessing import Pool
+
+from numpy import concatenate, full, nan, zeros
+from numpy.random import default_rng
+from pandas import DataFrame, Index
+from scipy.cluster.hierarchy import cophenet, linkage
+from scipy.spatial.distance import squareform
+
+from ..constant import RANDOM_SEED
+from .factorize import factorize
+
+
+def _factorize(ma_, me, re, ra, su, ke_ar):
+    maw_, mah_, er_ie_it = factorize(ma_, me, re, ra=ra, **ke_ar)
+
+    gr_ = concatenate([mah.argmax(axis=0) for mah in mah_])
+
+    er = er_ie_it[:, -1].sum()
+
+    if su:
+        return re, gr_, er, None
+
+    else:
+        return re, gr_, er, (maw_, mah_, er_ie_it)
+
+
+def _factorize_star(ar_):
+    return _factorize(*ar_)
+
+
+def _summarize(co_sa_sa, er_):
+    di_ = squareform(1 - co_sa_sa, checks=False)
+
+    if di_.size < 2 or (di_ == di_[0]).all():
+        cc = nan
+
+    else:
+        cc = cophenet(linkage(di_, method="average"), di_)[0]
+
+    return (
+        min(er_),
+        sum(er_) / len(er_),
+        cc,
+        (4 * (co_sa_sa - 0.5) ** 2).mean(),
+    )
+
+
+def sweep(ma_, me, re_, n_re=10, n_jo=1, ra=RANDOM_SEED, su=False, **ke_ar):
+    ra_ = default_rng(seed=ra).integers(2**31, size=n_re)
+
+    if me == "deep":
+        n_sa = ma_[0].shape[1]
+
+    elif me == "wide":
+        n_sa = sum(ma.shape[1] for ma in ma_)
+
+    re_co = {re: zeros([n_sa, n_sa]) for re in re_}
+
+    re_er_ = {re: [] for re in re_}
+
+    re_be = {}
+
+    po = Pool(processes=n_jo)
+
+    for re, gr_, er, fa in po.imap(
+        _factorize_star, ((ma_, me, re, rar, su, ke_ar) for re in re_ for rar in ra_)
+    ):
+        re_co[re] += gr_.reshape([-1, 1]) == gr_
+
+        re_er_[re].append(er)
+
+        if not su and (re not in re_be or er < re_be[re][0]):
+            re_be[re] = (er, fa)
+
+    po.terminate()
+
+    su_re_me = full([len(re_), 4], nan)
+
+    for ie, re in enumerate(re_):
+        re_co[re] /= n_re
+
+        su_re_me[ie] = _summarize(re_co[re], re_er_[re])
+
+    da = DataFrame(
+        data=su_re_me,
+        index=Index(data=re_, name="Rank"),
+        columns=["Best Error", "Mean Error", "Cophenetic Correlation", "Dispersion"],
+    )
+
+    if su:
+        return da, None
+
+    else:
+        return da, {re: (*re_be[re][1], re_co[re]) for re in re_}
@@ -1,5 +1,7 @@
 from .clean import clean
 from .get_absolute import get_absolute
+from .get_stamp import get_stamp
 from .list_child import list_child
 from .make import make
+from .open_text import open_text
 from .select import select
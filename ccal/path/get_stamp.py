@@ -0,0 +1,7 @@
+from os import stat
+
+
+def get_stamp(pa):
+    st = stat(pa)
+
+    return [st.st_size, st.st_mtime_ns]
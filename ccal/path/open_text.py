@@ -0,0 +1,12 @@
+from gzip import open as gzip_open
+
+
+def open_text(pa):
+    with open(pa, mode="rb") as io:
+        gz = io.read(2) == b"\x1f\x8b"
+
+    if gz:
+        return gzip_open(pa, mode="rt")
+
+    else:
+        return open(pa)
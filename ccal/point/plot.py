@@ -1,5 +1,8 @@
 from numpy import (
     absolute,
+    asarray,
+    concatenate,
+    histogram2d,
     inf,
     isnan,
     nan,
@@ -8,13 +11,16 @@ from numpy import (
     nanmean,
     nanmedian,
     nanmin,
+    split,
+    unique,
     where,
 )
 from plotly.colors import make_colorscale
 
 from ..array import get_not_nan_unique, guess_type
 from ..dictionary import merge
-from ..geometry import make_convex_hull, make_delaunay_triangulation
+from ..geometry import Triangulation
+from ..grid import make_1d_grid
 from ..plot import COLORBAR, NAME_COLORSCALE, get_color, plot_plotly
 
 
@@ -34,6 +40,9 @@ def plot(
     colorscales=NAME_COLORSCALE["continuous"],
     opacityn=0.5,
     poh_=(),
+    tr=None,
+    gl=False,
+    ag=None,
     pr="",
 ):
     title = "{} {} and {} {}".format(
@@ -69,15 +78,18 @@ def plot(
 
     data = []
 
-    ti1_, ti2_ = make_delaunay_triangulation(nu_no_di)
+    if tr is None:
+        tr = Triangulation(nu_no_di.values)
 
-    hu1_, hu2_ = make_convex_hull(nu_no_di)
+    ti1_, ti2_ = tr.make_delaunay_triangulation()
+
+    hu1_, hu2_ = tr.make_convex_hull()
 
     data.append(
         {
             "showlegend": False,
-            "y": ti1_ + hu1_,
-            "x": ti2_ + hu2_,
+            "y": concatenate([ti1_, hu1_]),
+            "x": concatenate([ti2_, hu2_]),
             "mode": "lines",
             "line": {"color": "#171412"},
         }
@@ -130,7 +142,7 @@ def plot(
                 "arrowwidth": arrowwidth,
                 "arrowcolor": arrowcolor,
             }
-            for no, (co1, co2) in nu_no_di.iterrows()
+            for no, (co1, co2) in zip(nu_no_di.index.values, nu_no_di.values)
         ]
 
     if bag_ is not None:
@@ -169,6 +181,16 @@ def plot(
                 }
             )
 
+    if gl:
+        typep = "scattergl"
+
+        nup_po_di = nu_po_di.values.astype("float32")
+
+    else:
+        typep = "scatter"
+
+        nup_po_di = nu_po_di.values
+
     if tracep is None:
         tracep = {}
 
@@ -178,6 +200,7 @@ def plot(
 
     tracep = merge(
         {
+            "type": typep,
             "name": nu_po_di.index.name,
             "mode": "markers",
             "marker": {
@@ -191,11 +214,45 @@ def plot(
         tracep,
     )
 
-    if gr_ is not None:
-        for gr in gru_:
-            name = "Group {}".format(gr)
+    po_ = nu_po_di.index.values
+
+    if ag == "grid":
+        if co_ is None:
+            co_ = make_1d_grid(0, 1, 1e-3, 128)
+
+        ha = (co_[1] - co_[0]) / 2
+
+        ed_ = concatenate([co_ - ha, co_[-1:] + ha])
+
+        n_co_co = histogram2d(nup_po_di[:, 0], nup_po_di[:, 1], bins=[ed_, ed_])[0]
+
+        data.append(
+            {
+                "type": "heatmap",
+                "name": nu_po_di.index.name,
+                "z": where(0 < n_co_co, n_co_co, nan).astype("float32"),
+                "y": co_,
+                "x": co_,
+                "colorscale": colorscales,
+                "colorbar": COLORBAR,
+                "hoverinfo": "z",
+            }
+        )
+
+    elif gr_ is not None:
+        gr_ = asarray(gr_)
 
-            nug_po_di = nu_po_di.loc[gr_ == gr, :]
+        ie_ = gr_.argsort(kind="stable")
+
+        gru_, ie1_ = unique(gr_[ie_], return_index=True)
+
+        if bag_ is None:
+            grf = gru_[0]
+
+            grl = gru_[-1]
+
+        for gr, ieg_ in zip(gru_, split(ie_, ie1_[1:])):
+            name = "Group {}".format(gr)
 
             data.append(
                 merge(
@@ -203,9 +260,9 @@ def plot(
                     {
                         "legendgroup": name,
                         "name": name,
-                        "y": nug_po_di.values[:, 0],
-                        "x": nug_po_di.values[:, 1],
-                        "text": nug_po_di.index.values,
+                        "y": nup_po_di[ieg_, 0],
+                        "x": nup_po_di[ieg_, 1],
+                        "text": po_[ieg_],
                         "marker": {"color": get_color(colorscaleg, gr, [grf, grl])},
                     },
                 )
@@ -218,7 +275,9 @@ def plot(
 
         sc_ = sc_[ie_]
 
-        nu_po_di = nu_po_di.iloc[ie_, :]
+        nup_po_di = nup_po_di[ie_]
+
+        po_ = po_[ie_]
 
         ty = guess_type(sc_)
 
@@ -245,9 +304,9 @@ def plot(
             merge(
                 tracep,
                 {
-                    "y": nu_po_di.values[:, 0],
-                    "x": nu_po_di.values[:, 1],
-                    "text": nu_po_di.index.values,
+                    "y": nup_po_di[:, 0],
+                    "x": nup_po_di[:, 1],
+                    "text": po_,
                     "marker": {
                         "color": sc_,
                         "colorscale": colorscales,
@@ -263,9 +322,9 @@ def plot(
             merge(
                 tracep,
                 {
-                    "y": nu_po_di.values[:, 0],
-                    "x": nu_po_di.values[:, 1],
-                    "text": nu_po_di.index.values,
+                    "y": nup_po_di[:, 0],
+                    "x": nup_po_di[:, 1],
+                    "text": po_,
                 },
             )
         )
@@ -1,17 +1,19 @@
-from numpy import full, nan
+from numpy import asarray, empty
 
 
-def pull(nu_no_di, nu_po_no):
+def pull(nu_no_di, nu_po_no, ex=1, n_ch=int(1e5)):
     n_po = nu_po_no.shape[0]
 
-    n_di = nu_no_di.shape[1]
+    nu_po_di = empty([n_po, nu_no_di.shape[1]])
 
-    nu_po_di = full([n_po, n_di], nan)
+    for ie in range(0, n_po, n_ch):
+        pu_po_no = asarray(nu_po_no[ie : ie + n_ch], dtype=float)
 
-    for iep in range(n_po):
-        pu_ = nu_po_no[iep, :]
+        if ex != 1:
+            pu_po_no = pu_po_no**ex
 
-        for ied in range(n_di):
-            nu_po_di[iep, ied] = (pu_ * nu_no_di[:, ied]).sum() / pu_.sum()
+        nu_po_di[ie : ie + n_ch] = (pu_po_no @ nu_no_di) / pu_po_no.sum(
+            axis=1, keepdims=True
+        )
 
     return nu_po_di
@@ -1,16 +1,85 @@
-from numpy import apply_along_axis
+from numpy import apply_along_axis, array, asarray, sqrt
+from numpy.linalg import eigh
+from numpy.random import default_rng
 from sklearn.manifold import MDS
 
 from ..array import normalize
-from ..constant import RANDOM_SEED
+from ..constant import FLOAT_RESOLUTION, RANDOM_SEED
 
 
-def scale(di_po_po, n_di, ra=RANDOM_SEED, **ke_ar):
-    return apply_along_axis(
-        normalize,
-        0,
-        MDS(
+def _select_landmark(di_po_po, n_la, ra):
+    ie_ = [default_rng(seed=ra).integers(di_po_po.shape[0])]
+
+    mi_ = di_po_po[ie_[0]].copy()
+
+    for _ in range(n_la - 1):
+        ie = mi_.argmax()
+
+        ie_.append(ie)
+
+        mi_ = mi_.clip(max=di_po_po[ie])
+
+    return ie_
+
+
+def _scale_landmark(di_po_po, n_di, n_la, ra):
+    n_la = min(n_la, di_po_po.shape[0])
+
+    assert n_di < n_la
+
+    ie_ = _select_landmark(di_po_po, n_la, ra)
+
+    di2_po_la = di_po_po[:, ie_] ** 2
+
+    di2_la_la = di2_po_la[ie_]
+
+    me_ = di2_la_la.mean(axis=0)
+
+    ce_la_la = di2_la_la - me_ - di2_la_la.mean(axis=1, keepdims=True) + me_.mean()
+
+    ei_, ve_la_di = eigh(-ce_la_la / 2)
+
+    ei_ = ei_[::-1][:n_di]
+
+    ve_la_di = ve_la_di[:, ::-1][:, :n_di]
+
+    po_ = FLOAT_RESOLUTION < ei_
+
+    if not po_.all():
+        print("Zeroing {} non-positive dimension(s)".format((~po_).sum()))
+
+    ve_la_di[:, po_] /= sqrt(ei_[po_])
+
+    ve_la_di[:, ~po_] = 0
+
+    return -(di2_po_la - me_) @ ve_la_di / 2
+
+
+def scale(
+    di_po_po, n_di, ra=RANDOM_SEED, me="smacof", n_la=256, nu_po_di=None, **ke_ar
+):
+    assert me in ["smacof", "landmark"], "Unknown method {}".format(me)
+
+    di_po_po = asarray(di_po_po)
+
+    if me == "landmark":
+        nu_po_di = _scale_landmark(di_po_po, n_di, n_la, ra)
+
+    elif me == "smacof":
+        if nu_po_di is not None:
+            ke_ar.setdefault("n_init", 1)
+
+        nu_po_di = MDS(
             n_components=n_di, random_state=ra, dissimilarity="precomputed", **ke_ar
-        ).fit_transform(di_po_po),
-        "0-1",
-    )
+        ).fit_transform(di_po_po, init=nu_po_di)
+
+    nu_po_di = array(nu_po_di, dtype=float)
+
+    va_ = nu_po_di.min(axis=0) < nu_po_di.max(axis=0)
+
+    if va_.any():
+        nu_po_di[:, va_] = apply_along_axis(normalize, 0, nu_po_di[:, va_], "0-1")
+
+    nu_po_di[:, ~va_] = 0
+
+    return nu_po_di
@@ -1,5 +1,13 @@
 from .ANN import ANN
+from .check_line import check_line
 from .COLUMN import COLUMN
 from .count_variant import count_variant
+from .make_index import make_index
 from .read import read
+from .read_cache import read_cache
+from .read_chunk import read_chunk
+from .read_genotype import read_genotype
+from .read_header import read_header
+from .read_region import read_region
 from .read_row import read_row
+from .write_cache import write_cache
@@ -0,0 +1,56 @@
+from numpy import inf
+
+from .ANN import ANN
+from .COLUMN import COLUMN
+
+IEM = ANN.index("impact")
+
+IEG = ANN.index("gene_name")
+
+
+def _get_annotation(io):
+    io = ";{}".format(io.rstrip("\n"))
+
+    ie = io.find(";ANN=")
+
+    if ie == -1:
+        return None
+
+    return io[ie + 5 :].split(sep=";", maxsplit=1)[0].split(sep=",")
+
+
+def _check_annotation(an, im_, ge_):
+    an_ = an.split(sep="|", maxsplit=max(IEM, IEG) + 1)
+
+    return (im_ is None or an_[IEM] in im_) and (ge_ is None or an_[IEG] in ge_)
+
+
+def check_line(li, fi=None, ch=None, st=0, en=inf, qu=None, im_=None, ge_=None):
+    if ch is not None and not li.startswith("{}\t".format(ch)):
+        return False
+
+    for ke_ in [im_, ge_]:
+        if ke_ is not None and not any(ke in li for ke in ke_):
+            return False
+
+    sp_ = li.split(sep="\t", maxsplit=COLUMN.index("INFO") + 1)
+
+    if not st <= int(sp_[COLUMN.index("POS")]) <= en:
+        return False
+
+    if qu is not None:
+        qul = sp_[COLUMN.index("QUAL")]
+
+        if qul == "." or float(qul) < qu:
+            return False
+
+    if fi is not None and sp_[COLUMN.index("FILTER")] != fi:
+        return False
+
+    if im_ is not None or ge_ is not None:
+        an_ = _get_annotation(sp_[COLUMN.index("INFO")])
+
+        if an_ is None or not any(_check_annotation(an, im_, ge_) for an in an_):
+            return False
+
+    return True
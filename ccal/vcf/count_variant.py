@@ -1,58 +1,194 @@
-from numpy import apply_along_axis
-from pandas import value_counts
+from collections import Counter
+from itertools import chain
+from multiprocessing import Pool
 
-from ..iterable import flatten
-from ..string import split_and_get
+from numpy import int64, isin, unique
+from pandas import Series
+
+from ..path import open_text
 from .ANN import ANN
+from .check_line import _check_annotation, _get_annotation, check_line
 from .COLUMN import COLUMN
-from .read import read
+from .read_cache import _get_code, _select, read_cache
+
+IEF = COLUMN.index("FILTER")
+
+IEI = COLUMN.index("INFO")
+
+IEG = ANN.index("gene_name")
+
+IEE = ANN.index("effect")
+
+
+def _list_variant(io, im_, ge_):
+    an_ = _get_annotation(io)
+
+    if an_ is None:
+        return set()
+
+    va_ = set()
+
+    for an in an_:
+        if (im_ is not None or ge_ is not None) and not _check_annotation(an, im_, ge_):
+            continue
+
+        sp_ = an.split(sep="|", maxsplit=IEG + 1)
+
+        va_.add("{} ({})".format(sp_[IEG], sp_[IEE]))
+
+    return va_
+
+
+def _count(li_, ke_ar):
+    n_ro = 0
 
+    n_pa = 0
 
-def _get_info(io, ket):
-    for sp in io.split(sep=";"):
-        if "=" in sp:
-            ke, va = sp.split(sep="=")
+    va_n_pa = Counter()
 
-            if ke == ket:
-                return va
+    va_n_al = Counter()
 
+    for li in li_:
+        if 0 < len(ke_ar) and not check_line(li, **ke_ar):
+            continue
 
-def _get_info_ann(io, ket, n_an=None):
-    an = _get_info(io, "ANN")
+        n_ro += 1
 
-    if an is not None:
-        ie = ANN.index(ket)
+        sp_ = li.split(sep="\t", maxsplit=IEI + 1)
 
-        return [split_and_get(sp, "|", ie) for sp in an.split(sep=",")[:n_an]]
+        va_ = _list_variant(sp_[IEI], ke_ar.get("im_"), ke_ar.get("ge_"))
 
+        va_n_al.update(va_)
 
-def _list_variant(st_):
-    io = st_[COLUMN.index("INFO")]
+        if sp_[IEF] == "PASS":
+            n_pa += 1
 
-    return set(
-        "{} ({})".format(ge, ef)
-        for ge, ef in zip(_get_info_ann(io, "gene_name"), _get_info_ann(io, "effect"))
+            va_n_pa.update(va_)
+
+    return n_ro, n_pa, va_n_pa, va_n_al
+
+
+def _count_cache(ca, ke_ar):
+    ro_, an_ = _select(ca, **ke_ar)
+
+    ro_an_ = ca["annotation_row"]
+
+    an_ &= ro_[ro_an_]
+
+    ge_ = ca["gene_name_"]
+
+    ef_ = ca["effect_"]
+
+    n_va = len(ge_) * len(ef_)
+
+    rova_ = unique(
+        ro_an_[an_] * n_va
+        + ca["annotation_gene_name"][an_].astype(int64) * len(ef_)
+        + ca["annotation_effect"][an_]
     )
 
+    pa_ = ro_ & isin(ca["FILTER"], _get_code(ca, "FILTER", ["PASS"]))
+
+    va_n_ = []
+
+    for rovas_ in [rova_[pa_[rova_ // n_va]], rova_]:
+        va_n = Counter()
+
+        for va, n in zip(*unique(rovas_ % n_va, return_counts=True)):
+            va_n["{} ({})".format(ge_[va // len(ef_)], ef_[va % len(ef_)])] = int(n)
+
+        va_n_.append(va_n)
+
+    return ro_.sum(), pa_.sum(), *va_n_
+
 
-def count_variant(pa):
-    da = read(pa)
+def _batch(pa, n_ro):
+    li_ = []
 
-    print(da.shape)
+    chp = None
 
-    fi_ = da.iloc[:, COLUMN.index("FILTER")].values
+    with open_text(pa) as io:
+        for li in io:
+            if li.startswith("#"):
+                continue
 
-    if "PASS" in fi_:
+            ch = li[: li.find("\t")]
+
+            if len(li_) == n_ro or (ch != chp and 0 < len(li_)):
+                yield li_
+
+                li_ = []
+
+            li_.append(li)
+
+            chp = ch
+
+    if 0 < len(li_):
+        yield li_
+
+
+def _count_file(pa, n_ro, n_jo, ke_ar):
+    n_ro_ = 0
+
+    n_pa = 0
+
+    va_n_pa = Counter()
+
+    va_n_al = Counter()
+
+    po = Pool(processes=n_jo)
+
+    li__ = []
+
+    for li_ in chain(_batch(pa, n_ro), [None]):
+        if li_ is not None:
+            li__.append(li_)
+
+        if len(li__) == n_jo or (li_ is None and 0 < len(li__)):
+            for n_ro_b, n_pa_b, va_n_pa_b, va_n_al_b in po.starmap(
+                _count, ([lib_, ke_ar] for lib_ in li__)
+            ):
+                n_ro_ += n_ro_b
+
+                n_pa += n_pa_b
+
+                va_n_pa.update(va_n_pa_b)
+
+                va_n_al.update(va_n_al_b)
+
+            li__ = []
+
+    po.terminate()
+
+    return n_ro_, n_pa, va_n_pa, va_n_al
+
+
+def count_variant(pa, n_ro=int(1e5), n_jo=1, **ke_ar):
+    ca = read_cache(pa)
+
+    if ca is None:
+        n_ro_, n_pa, va_n_pa, va_n_al = _count_file(pa, n_ro, n_jo, ke_ar)
+
+    else:
+        n_ro_, n_pa, va_n_pa, va_n_al = _count_cache(ca, ke_ar)
+
+    print(n_ro_)
+
+    if 0 < n_pa:
         print("Using only 'PASS'")
 
-        da = da.loc[fi_ == "PASS", :]
+        print(n_pa)
 
-        print(da.shape)
+        va_n = va_n_pa
 
     else:
         print("There is no 'PASS' and using all")
 
-    va_co = value_counts(flatten(apply_along_axis(_list_variant, 1, da.values)))
+        va_n = va_n_al
+
+    va_co = Series(
+        dict(sorted(va_n.items(), key=lambda vn: (-vn[1], vn[0]))), dtype=int
+    )
 
     va_co.index.name = "Variant"
 
@@ -0,0 +1,98 @@
+from struct import unpack
+from zlib import decompress
+
+from pandas import DataFrame
+
+INDEX_COLUMN = ["CHROM", "Start", "End", "Block Offset", "Line Offset"]
+
+
+def _read_block(io):
+    he = io.read(12)
+
+    if len(he) < 12:
+        return None
+
+    assert he[:4] == b"\x1f\x8b\x08\x04", "Not BGZF"
+
+    ex = io.read(unpack("<H", he[10:12])[0])
+
+    ie = 0
+
+    while ex[ie : ie + 2] != b"BC":
+        ie += 4 + unpack("<H", ex[ie + 2 : ie + 4])[0]
+
+        assert ie < len(ex), "Not BGZF"
+
+    bs = unpack("<H", ex[ie + 4 : ie + 6])[0]
+
+    return decompress(io.read(bs - 11 - len(ex))[:-8], wbits=-15)
+
+
+def _add(ro_, li, co, uo):
+    if li.startswith(b"#"):
+        return
+
+    ch, po = li.split(sep=b"\t", maxsplit=2)[:2]
+
+    ch = ch.decode()
+
+    po = int(po)
+
+    if 0 < len(ro_) and ro_[-1][0] == ch and ro_[-1][3] == co:
+        ro_[-1][2] = po
+
+    else:
+        ro_.append([ch, po, po, co, uo])
+
+
+def make_index(pa):
+    ro_ = []
+
+    ca = b""
+
+    cac = uoc = None
+
+    with open(pa, mode="rb") as io:
+        while True:
+            co = io.tell()
+
+            bl = _read_block(io)
+
+            if bl is None:
+                break
+
+            ie = 0
+
+            if 0 < len(ca):
+                ien = bl.find(b"\n")
+
+                if ien == -1:
+                    ca += bl
+
+                    continue
+
+                _add(ro_, ca + bl[:ien], cac, uoc)
+
+                ie = ien + 1
+
+            while True:
+                ien = bl.find(b"\n", ie)
+
+                if ien == -1:
+                    ca = bl[ie:]
+
+                    cac = co
+
+                    uoc = ie
+
+                    break
+
+                _add(ro_, bl[ie:ien], co, ie)
+
+                ie = ien + 1
+
+    da = DataFrame(data=ro_, columns=INDEX_COLUMN)
+
+    da.to_csv("{}.index.tsv".format(pa), sep="\t", index=False)
+
+    return da
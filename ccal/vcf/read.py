@@ -1,5 +1,42 @@
-from pandas import read_csv
+from numpy import array
+from pandas import DataFrame, Series, concat, read_csv, to_numeric
+
+from .read_cache import _get_text, read_cache
+
+
+def _infer(va_):
+    se = Series(data=va_)
+
+    try:
+        return to_numeric(se)
+
+    except ValueError:
+        return se
 
 
 def read(pa):
-    return read_csv(pa, sep="\t", comment="#", header=None, low_memory=False)
+    ca = read_cache(pa)
+
+    if ca is None:
+        return read_csv(pa, sep="\t", comment="#", header=None, low_memory=False)
+
+    co_ = [
+        array(ca["CHROM_"])[ca["CHROM"]],
+        ca["POS"],
+        *(_get_text(ca, co) for co in ["ID", "REF", "ALT", "QUAL"]),
+        array(ca["FILTER_"])[ca["FILTER"]],
+        _get_text(ca, "INFO"),
+    ]
+
+    da = DataFrame(data={ie: _infer(co) for ie, co in enumerate(co_)})
+
+    sa_ = _get_text(ca, "sample")
+
+    if any(sa != "" for sa in sa_):
+        das = Series(data=sa_).str.split(pat="\t", expand=True)
+
+        das.columns = range(len(co_), len(co_) + das.shape[1])
+
+        da = concat([da, das.apply(_infer)], axis=1)
+
+    return da
@@ -0,0 +1,128 @@
+from json import load as json_load
+from os.path import exists, getsize, join
+
+from numpy import float64, inf, isin, load, memmap, ones, uint8, zeros
+
+from ..path import get_stamp
+
+TEXT = ["ID", "REF", "ALT", "QUAL", "INFO", "sample"]
+
+MATRIX = ["GT", "RD", "AD", "DP"]
+
+
+def _map(pa, dt, sh):
+    if getsize(pa) == 0:
+        return zeros(0 if sh is None else sh, dtype=dt)
+
+    else:
+        return memmap(pa, dtype=dt, mode="r", shape=sh)
+
+
+def _get_code(ca, ke, va_):
+    ie_ = ca["{}_".format(ke)]
+
+    return [ie_.index(va) for va in va_ if va in ie_]
+
+
+def _select(ca, fi=None, ch=None, st=0, en=inf, qu=None, im_=None, ge_=None):
+    po_ = ca["POS"]
+
+    ro_ = (st <= po_) & (po_ <= en)
+
+    if ch is not None:
+        ro_ &= isin(ca["CHROM"], _get_code(ca, "CHROM", [ch]))
+
+    if qu is not None:
+        ro_ &= qu <= ca["QUAL"]
+
+    if fi is not None:
+        ro_ &= isin(ca["FILTER"], _get_code(ca, "FILTER", [fi]))
+
+    an_ = ones(ca["annotation_row"].size, dtype=bool)
+
+    for ke, va_ in [("impact", im_), ("gene_name", ge_)]:
+        if va_ is not None:
+            an_ &= isin(ca["annotation_{}".format(ke)], _get_code(ca, ke, va_))
+
+    if im_ is not None or ge_ is not None:
+        ha_ = zeros(ro_.size, dtype=bool)
+
+        ha_[ca["annotation_row"][an_]] = True
+
+        ro_ &= ha_
+
+    return ro_, an_
+
+
+def _get_text(ca, co, ie_=None):
+    by_ = ca["{}_text".format(co)]
+
+    if ie_ is None:
+        return bytes(by_).decode().split(sep="\n")[:-1]
+
+    else:
+        of_ = ca["{}_offset".format(co)]
+
+        return [bytes(by_[of_[ie] : of_[ie + 1] - 1]).decode() for ie in ie_]
+
+
+def _get_row(ca, ie_):
+    te_ = {co: _get_text(ca, co, ie_=ie_) for co in TEXT}
+
+    st__ = []
+
+    for ie2, ie in enumerate(ie_):
+        st_ = [
+            ca["CHROM_"][ca["CHROM"][ie]],
+            str(ca["POS"][ie]),
+            *(te_[co][ie2] for co in ["ID", "REF", "ALT", "QUAL"]),
+            ca["FILTER_"][ca["FILTER"][ie]],
+            te_["INFO"][ie2],
+        ]
+
+        if te_["sample"][ie2] != "":
+            st_ += te_["sample"][ie2].split(sep="\t")
+
+        st__.append(st_)
+
+    return st__
+
+
+def read_cache(pa):
+    pac = "{}.cache".format(pa)
+
+    paj = join(pac, "cache.json")
+
+    if not exists(paj):
+        return None
+
+    with open(paj) as io:
+        ca = json_load(io)
+
+    if ca["stamp"] != get_stamp(pa):
+        return None
+
+    for ke in ["CHROM", "POS", "QUAL", "FILTER"]:
+        ca[ke] = load(join(pac, "{}.npy".format(ke)), mmap_mode="r")
+
+    if ca["QUAL"].dtype != float64:
+        return None
+
+    for ke in ["row", "effect", "impact", "gene_name"]:
+        ke = "annotation_{}".format(ke)
+
+        ca[ke] = load(join(pac, "{}.npy".format(ke)), mmap_mode="r")
+
+    for co in TEXT:
+        ca["{}_text".format(co)] = _map(join(pac, "{}.bin".format(co)), uint8, None)
+
+        ca["{}_offset".format(co)] = load(
+            join(pac, "{}_offset.npy".format(co)), mmap_mode="r"
+        )
+
+    for ke, dt in zip(MATRIX, ["int8", "int32", "int32", "int32"]):
+        ca[ke] = _map(
+            join(pac, "{}.bin".format(ke)), dt, (ca["n_ro"], len(ca["sample_"]))
+        )
+
+    return ca
@@ -0,0 +1,46 @@
+from pandas import DataFrame, to_numeric
+
+from ..path import open_text
+from .check_line import check_line
+from .COLUMN import COLUMN
+from .read_header import read_header
+
+
+def _make_dataframe(ro_, co_):
+    da = DataFrame(data=ro_, columns=co_)
+
+    if "POS" in co_:
+        da["POS"] = da["POS"].astype(int)
+
+    if "QUAL" in co_:
+        da["QUAL"] = to_numeric(da["QUAL"], errors="coerce")
+
+    return da
+
+
+def read_chunk(pa, n_ro=int(1e5), co_=None, **ke_ar):
+    na_ = COLUMN + read_header(pa)["sample"]
+
+    if co_ is None:
+        co_ = na_
+
+    ie_ = [na_.index(co) for co in co_]
+
+    ro_ = []
+
+    with open_text(pa) as io:
+        for li in io:
+            if li.startswith("#") or (0 < len(ke_ar) and not check_line(li, **ke_ar)):
+                continue
+
+            sp_ = li.rstrip("\n").split(sep="\t")
+
+            ro_.append([sp_[ie] for ie in ie_])
+
+            if len(ro_) == n_ro:
+                yield _make_dataframe(ro_, co_)
+
+                ro_ = []
+
+    if 0 < len(ro_):
+        yield _make_dataframe(ro_, co_)
@@ -0,0 +1,161 @@
+from numpy import concatenate, flatnonzero, full, int8, int32
+from pandas import DataFrame, Index, to_numeric
+
+from ..path import open_text
+from .check_line import check_line
+from .COLUMN import COLUMN
+from .read_cache import MATRIX, _get_row, _select, read_cache
+from .read_header import read_header
+
+IEO = COLUMN.index("FORMAT")
+
+
+def _count_alternate(gt):
+    al_ = gt.replace("|", "/").split(sep="/")
+
+    if "." in al_:
+        return -1
+
+    else:
+        return sum(al != "0" for al in al_)
+
+
+def _parse_depth(ad):
+    if ad in ["", "."]:
+        return -1, -1
+
+    ad_ = ad.split(sep=",")
+
+    if "." in ad_:
+        return -1, -1
+
+    return int(ad_[0]), sum(int(ad) for ad in ad_[1:])
+
+
+def _parse(li_, n_sa, fo_ie_, gt_n):
+    n_ro = len(li_)
+
+    me_ = []
+
+    gt = full([n_ro, n_sa], -1, dtype=int8)
+
+    rd = full([n_ro, n_sa], -1, dtype=int32)
+
+    ad = full([n_ro, n_sa], -1, dtype=int32)
+
+    dp = full([n_ro, n_sa], -1, dtype=int32)
+
+    for ier, li in enumerate(li_):
+        sp_ = li.rstrip("\n").split(sep="\t")
+
+        me_.append(sp_[: IEO - 1])
+
+        if len(sp_) <= IEO:
+            continue
+
+        fo = sp_[IEO]
+
+        if fo not in fo_ie_:
+            fo_ = fo.split(sep=":")
+
+            fo_ie_[fo] = [
+                fo_.index(ke) if ke in fo_ else None for ke in ["GT", "AD", "DP"]
+            ]
+
+        iet, iea, ied = fo_ie_[fo]
+
+        for ies, sa in enumerate(sp_[IEO + 1 :]):
+            sa_ = sa.split(sep=":")
+
+            n_fi = len(sa_)
+
+            if iet is not None and iet < n_fi:
+                gts = sa_[iet]
+
+                if gts not in gt_n:
+                    gt_n[gts] = _count_alternate(gts)
+
+                gt[ier, ies] = gt_n[gts]
+
+            if iea is not None and iea < n_fi:
+                rd[ier, ies], ad[ier, ies] = _parse_depth(sa_[iea])
+
+            if ied is not None and ied < n_fi and sa_[ied] not in ["", "."]:
+                dp[ier, ies] = int(sa_[ied])
+
+    return me_, gt, rd, ad, dp
+
+
+def _make(me_, ma_, sa_):
+    da = DataFrame(data=me_, columns=COLUMN[: IEO - 1], dtype=str)
+
+    da["POS"] = da["POS"].astype(int32)
+
+    da["QUAL"] = to_numeric(da["QUAL"], errors="coerce").astype("float32")
+
+    for co in ["CHROM", "FILTER"]:
+        da[co] = da[co].astype("category")
+
+    da.index = Index(
+        data=da["CHROM"].astype(str)
+        + ":"
+        + da["POS"].astype(str)
+        + ":"
+        + da["REF"]
+        + ":"
+        + da["ALT"],
+        name="Variant",
+    )
+
+    co = Index(data=sa_, name="Sample")
+
+    return da, {
+        ke: DataFrame(data=ma, index=da.index, columns=co)
+        for ke, ma in zip(["GT", "RD", "AD", "DP"], ma_)
+    }
+
+
+def read_genotype(pa, n_ro=int(1e5), **ke_ar):
+    ca = read_cache(pa)
+
+    if ca is not None:
+        ie_ = flatnonzero(_select(ca, **ke_ar)[0])
+
+        return _make(
+            [st_[: IEO - 1] for st_ in _get_row(ca, ie_)],
+            [ca[ke][ie_] for ke in MATRIX],
+            ca["sample_"],
+        )
+
+    sa_ = read_header(pa)["sample"]
+
+    n_sa = len(sa_)
+
+    fo_ie_ = {}
+
+    gt_n = {}
+
+    pa_ = []
+
+    li_ = []
+
+    with open_text(pa) as io:
+        for li in io:
+            if li.startswith("#") or (0 < len(ke_ar) and not check_line(li, **ke_ar)):
+                continue
+
+            li_.append(li)
+
+            if len(li_) == n_ro:
+                pa_.append(_parse(li_, n_sa, fo_ie_, gt_n))
+
+                li_ = []
+
+    if 0 < len(li_) or len(pa_) == 0:
+        pa_.append(_parse(li_, n_sa, fo_ie_, gt_n))
+
+    return _make(
+        [me for pa in pa_ for me in pa[0]],
+        [concatenate([pa[ie] for pa in pa_]) for ie in range(1, 5)],
+        sa_,
+    )
@@ -0,0 +1,35 @@
+from re import findall
+
+from ..path import open_text
+from .COLUMN import COLUMN
+
+
+def _parse_definition(li):
+    return {
+        ke: va.strip('"')
+        for ke, va in findall(r'(\w+)=("[^"]*"|[^,>]*)', li[li.index("<") + 1 :])
+    }
+
+
+def read_header(pa):
+    he = {"INFO": {}, "FORMAT": {}, "sample": [], "n_li": 0}
+
+    with open_text(pa) as io:
+        for li in io:
+            if not li.startswith("#"):
+                break
+
+            he["n_li"] += 1
+
+            li = li.rstrip("\n")
+
+            for ke in ["INFO", "FORMAT"]:
+                if li.startswith("##{}=<".format(ke)):
+                    de = _parse_definition(li)
+
+                    he[ke][de.pop("ID")] = de
+
+            if li.startswith("#CHROM"):
+                he["sample"] = li.split(sep="\t")[len(COLUMN) :]
+
+    return he
@@ -0,0 +1,84 @@
+from os.path import exists, getmtime
+
+from numpy import flatnonzero, inf
+from pandas import read_csv
+
+from .check_line import check_line
+from .make_index import _read_block, make_index
+from .read_cache import _get_row, _select, read_cache
+from .read_row import read_row
+
+
+def _read_index(pa):
+    pai = "{}.index.tsv".format(pa)
+
+    if exists(pai) and getmtime(pa) <= getmtime(pai):
+        return read_csv(pai, sep="\t", dtype={"CHROM": str})
+
+    else:
+        print("Indexing {}".format(pa))
+
+        return make_index(pa)
+
+
+def read_region(pa, ch, st=0, en=inf, n_an=None, fi=None, qu=None, im_=None, ge_=None):
+    cac = read_cache(pa)
+
+    if cac is not None:
+        ie_ = flatnonzero(
+            _select(cac, fi=fi, ch=ch, st=st, en=en, qu=qu, im_=im_, ge_=ge_)[0]
+        )
+
+        return [
+            read_row(st_, n_an=n_an, im_=im_, ge_=ge_) for st_ in _get_row(cac, ie_)
+        ]
+
+    da = _read_index(pa)
+
+    da = da.loc[(da["CHROM"] == ch) & (st <= da["End"]) & (da["Start"] <= en)]
+
+    div_ = []
+
+    if da.shape[0] == 0:
+        return div_
+
+    co, uo = da.iloc[0][["Block Offset", "Line Offset"]]
+
+    with open(pa, mode="rb") as io:
+        io.seek(co)
+
+        ca = _read_block(io)[uo:]
+
+        while True:
+            bl = _read_block(io)
+
+            if bl is None:
+                li_ = [ca]
+
+            else:
+                ca += bl
+
+                li_ = ca.split(sep=b"\n")
+
+                ca = li_.pop()
+
+            for li in li_:
+                if len(li) == 0:
+                    continue
+
+                li = li.decode()
+
+                st_ = li.split(sep="\t", maxsplit=2)
+
+                po = int(st_[1])
+
+                if st_[0] != ch or en < po:
+                    return div_
+
+                if st <= po and check_line(li, fi=fi, qu=qu, im_=im_, ge_=ge_):
+                    div_.append(
+                        read_row(li.split(sep="\t"), n_an=n_an, im_=im_, ge_=ge_)
+                    )
+
+            if bl is None:
+                return div_
@@ -1,4 +1,5 @@
 from .ANN import ANN
+from .check_line import _check_annotation
 from .COLUMN import COLUMN
 
 
@@ -43,17 +44,22 @@ def _extend(div):
             float(ca) for ca in div["CAF"].split(sep=",")
         ]
 
-    for dis in div["sample"].values():
-        if "GT" in dis:
+    for dis in div["sample"]:
+        if "GT" in dis and "." not in dis["GT"]:
             dis["genotype"] = _get_genotype(re, al, dis["GT"])
 
-        if "AD" in dis and "DP" in dis:
+        if (
+            "AD" in dis
+            and "DP" in dis
+            and "." not in dis["AD"]
+            and dis["DP"] not in [".", "0"]
+        ):
             dis["allelic_frequency"] = [
                 int(ad) / int(dis["DP"]) for ad in dis["AD"].split(sep=",")
             ]
 
 
-def read_row(st_, n_an=None):
+def read_row(st_, n_an=None, im_=None, ge_=None):
     div = {co: st_[ie] for ie, co in enumerate(COLUMN[: COLUMN.index("FILTER") + 1])}
 
     no_ = []
@@ -66,6 +72,11 @@ def read_row(st_, n_an=None):
                 div["ANN"] = []
 
                 for an in vai.split(sep=",")[:n_an]:
+                    if (im_ is not None or ge_ is not None) and not _check_annotation(
+                        an, im_, ge_
+                    ):
+                        continue
+
                     an_ = an.split(sep="|")
 
                     div["ANN"].append(
@@ -83,12 +94,13 @@ def read_row(st_, n_an=None):
 
     ief = COLUMN.index("FORMAT")
 
-    fo_ = st_[ief].split(sep=":")
-
     div["sample"] = []
 
-    for ies, sa in enumerate(st_[ief + 1 :]):
-        div["sample"].append({fo: sav for fo, sav in zip(fo_, sa.split(sep=":"))})
+    if ief < len(st_):
+        fo_ = st_[ief].split(sep=":")
+
+        for ies, sa in enumerate(st_[ief + 1 :]):
+            div["sample"].append({fo: sav for fo, sav in zip(fo_, sa.split(sep=":"))})
 
     _extend(div)
 
@@ -0,0 +1,153 @@
+from json import dump
+from os import makedirs, remove
+from os.path import exists, join
+
+from numpy import array, float64, int8, int16, int32, int64, nan, save
+
+from ..path import get_stamp, open_text
+from .ANN import ANN
+from .check_line import _get_annotation
+from .read_cache import MATRIX, TEXT
+from .read_genotype import _parse
+from .read_header import read_header
+
+IEE = ANN.index("effect")
+
+IEM = ANN.index("impact")
+
+IEG = ANN.index("gene_name")
+
+
+def _write_chunk(li_, n_sa, fo_ie_, gt_n, io_, of_):
+    for ke, ma in zip(MATRIX, _parse(li_, n_sa, fo_ie_, gt_n)[1:]):
+        ma.tofile(io_[ke])
+
+    for li in li_:
+        sp_ = li.rstrip("\n").split(sep="\t", maxsplit=8)
+
+        sp_ += [""] * (9 - len(sp_))
+
+        for co, te in zip(TEXT, [sp_[2], sp_[3], sp_[4], sp_[5], sp_[7], sp_[8]]):
+            by = "{}\n".format(te).encode()
+
+            io_[co].write(by)
+
+            of_[co].append(of_[co][-1] + len(by))
+
+
+def write_cache(pa, n_ro=int(1e5)):
+    pac = "{}.cache".format(pa)
+
+    makedirs(pac, exist_ok=True)
+
+    paj = join(pac, "cache.json")
+
+    if exists(paj):
+        remove(paj)
+
+    sa_ = read_header(pa)["sample"]
+
+    n_sa = len(sa_)
+
+    ke_ie_ = {ke: {} for ke in ["CHROM", "FILTER", "effect", "impact", "gene_name"]}
+
+    ke_ = {ke: [] for ke in ["CHROM", "POS", "QUAL", "FILTER"]}
+
+    an_ = {ke: [] for ke in ["row", "effect", "impact", "gene_name"]}
+
+    of_ = {co: [0] for co in TEXT}
+
+    io_ = {co: open(join(pac, "{}.bin".format(co)), mode="wb") for co in TEXT + MATRIX}
+
+    fo_ie_ = {}
+
+    gt_n = {}
+
+    li_ = []
+
+    ier = 0
+
+    try:
+        with open_text(pa) as io:
+            for li in io:
+                if li.startswith("#"):
+                    continue
+
+                sp_ = li.split(sep="\t", maxsplit=8)
+
+                ke_["CHROM"].append(
+                    ke_ie_["CHROM"].setdefault(sp_[0], len(ke_ie_["CHROM"]))
+                )
+
+                ke_["POS"].append(int(sp_[1]))
+
+                ke_["QUAL"].append(nan if sp_[5] == "." else float(sp_[5]))
+
+                ke_["FILTER"].append(
+                    ke_ie_["FILTER"].setdefault(sp_[6], len(ke_ie_["FILTER"]))
+                )
+
+                an__ = _get_annotation(sp_[7])
+
+                if an__ is not None:
+                    for an in an__:
+                        spa_ = an.split(sep="|", maxsplit=max(IEE, IEM, IEG) + 1)
+
+                        an_["row"].append(ier)
+
+                        for ke, ie in [
+                            ("effect", IEE),
+                            ("impact", IEM),
+                            ("gene_name", IEG),
+                        ]:
+                            an_[ke].append(
+                                ke_ie_[ke].setdefault(spa_[ie], len(ke_ie_[ke]))
+                            )
+
+                ier += 1
+
+                li_.append(li)
+
+                if len(li_) == n_ro:
+                    _write_chunk(li_, n_sa, fo_ie_, gt_n, io_, of_)
+
+                    li_ = []
+
+        _write_chunk(li_, n_sa, fo_ie_, gt_n, io_, of_)
+
+    finally:
+        for io in io_.values():
+            io.close()
+
+    for ke, dt in [
+        ("CHROM", int16),
+        ("POS", int64),
+        ("QUAL", float64),
+        ("FILTER", int16),
+    ]:
+        save(join(pac, "{}.npy".format(ke)), array(ke_[ke], dtype=dt))
+
+    for ke, dt in [
+        ("row", int64),
+        ("effect", int32),
+        ("impact", int8),
+        ("gene_name", int32),
+    ]:
+        save(join(pac, "annotation_{}.npy".format(ke)), array(an_[ke], dtype=dt))
+
+    for co in TEXT:
+        save(join(pac, "{}_offset.npy".format(co)), array(of_[co], dtype=int64))
+
+    with open(paj, mode="w") as io:
+        dump(
+            {
+                "stamp": get_stamp(pa),
+                "n_ro": ier,
+                "sample_": sa_,
+                **{"{}_".format(ke): list(ie_) for ke, ie_ in ke_ie_.items()},
+            },
+            io,
+            indent=2,
+        )
+
+    print("Wrote {}".format(pac))